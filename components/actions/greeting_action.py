@@ -14,6 +14,28 @@ from typing import Tuple
 import random
 
 
+# ==================== 问候素材 ====================
+# 时间相关的问候
+_TIME_GREETINGS = {
+    "morning": ("早上好", "上午好", "Good morning"),
+    "afternoon": ("下午好", "Good afternoon"),
+    "evening": ("晚上好", "Good evening", "晚安")
+}
+
+# 不同类型的基础问候
+_BASE_GREETINGS = {
+    "formal": ("您好", "很高兴见到您", "欢迎"),
+    "casual": ("嗨", "你好呀", "Hey"),
+    "friendly": ("你好", "很高兴遇到你", "Hi there")
+}
+
+# 友好的后缀
+_FRIENDLY_SUFFIXES = ("！", "~", "！😊", "！很高兴见到你")
+
+# 随问候发送的表情
+_EMOJIS = ("😊", "👋", "🌟", "💫", "✨")
+
+
 class GreetingAction(BaseAction):
     """
     智能问候Action
@@ -76,6 +98,9 @@ class GreetingAction(BaseAction):
     
     associated_types = ["text", "emoji"]
     
+    # 问候内容选择使用的随机数生成器，所有实例共享
+    _rng = random.Random()
+    
     # ==================== 执行逻辑 ====================
     async def execute(self) -> Tuple[bool, str]:
         """
@@ -87,16 +112,18 @@ class GreetingAction(BaseAction):
         - 清晰的返回值
         - 适当的日志记录
         """
+        # 配置在每次执行中只读取一次，异常处理中复用
+        debug_mode = False
         try:
             # 检查功能是否启用
             if not self.get_config("features.enable_greetings", True):
                 return False, "问候功能已禁用"
             
             # 获取配置
+            debug_mode = self.get_config("plugin.debug_mode", False)
             greeting_keywords = self.get_config("actions.greeting_keywords", 
                                               ["你好", "hello", "hi", "嗨"])
             enable_emoji = self.get_config("actions.enable_emoji", True)
-            debug_mode = self.get_config("plugin.debug_mode", False)
             
             # 更新激活关键词（配置驱动）
             self.activation_keywords = greeting_keywords
@@ -116,15 +143,13 @@ class GreetingAction(BaseAction):
                 greeting_type, user_name, time_context, custom_message
             )
             
-            # 发送问候消息
-            await self.send_text(greeting_message)
-            
-            # 根据配置添加表情
+            # 根据配置添加表情，与问候合并为一条消息发送
             if enable_emoji:
-                emoji_list = ["😊", "👋", "🌟", "💫", "✨"]
-                selected_emoji = random.choice(emoji_list)
+                selected_emoji = self._rng.choice(_EMOJIS)
                 # 注意：这里应该使用 send_text 而不是 send_emoji，因为示例中没有表情包文件
-                await self.send_text(selected_emoji)
+                await self.send_text(f"{greeting_message} {selected_emoji}")
+            else:
+                await self.send_text(greeting_message)
             
             # 记录动作信息
             await self.store_action_info(
@@ -142,7 +167,7 @@ class GreetingAction(BaseAction):
             error_msg = f"问候Action执行失败: {str(e)}"
             
             # 调试模式下显示详细错误
-            if self.get_config("plugin.debug_mode", False):
+            if debug_mode:
                 await self.send_text(f"❌ {error_msg}")
             
             return False, error_msg
@@ -158,35 +183,19 @@ class GreetingAction(BaseAction):
         if custom_message:
             return custom_message
         
-        # 时间相关的问候
-        time_greetings = {
-            "morning": ["早上好", "上午好", "Good morning"],
-            "afternoon": ["下午好", "Good afternoon"],
-            "evening": ["晚上好", "Good evening", "晚安"]
-        }
-        
-        # 根据类型选择问候方式
-        if greeting_type == "formal":
-            base_greetings = ["您好", "很高兴见到您", "欢迎"]
-        elif greeting_type == "casual":
-            base_greetings = ["嗨", "你好呀", "Hey"]
-        else:  # friendly
-            base_greetings = ["你好", "很高兴遇到你", "Hi there"]
-        
-        # 组合问候消息
-        if time_context and time_context in time_greetings:
-            greeting_options = time_greetings[time_context]
+        # 组合问候消息：优先使用时间相关的问候，否则按类型选择（默认friendly）
+        if time_context and time_context in _TIME_GREETINGS:
+            greeting_options = _TIME_GREETINGS[time_context]
         else:
-            greeting_options = base_greetings
+            greeting_options = _BASE_GREETINGS.get(greeting_type, _BASE_GREETINGS["friendly"])
         
-        selected_greeting = random.choice(greeting_options)
+        selected_greeting = self._rng.choice(greeting_options)
         
         # 添加用户名
         if user_name:
             selected_greeting += f"，{user_name}"
         
         # 添加友好的后缀
-        friendly_suffixes = ["！", "~", "！😊", "！很高兴见到你"]
-        selected_greeting += random.choice(friendly_suffixes)
+        selected_greeting += self._rng.choice(_FRIENDLY_SUFFIXES)
         
         return selected_greeting
@@ -10,11 +10,91 @@
 """
 
 from src.plugin_system import BaseAction, ActionActivationType, ChatMode
-from typing import Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
 import random
 import time
 
 
+_MISSING = object()
+
+# 基础回复模板
+_RESPONSE_TEMPLATES = {
+    "informative": (
+        "关于这个话题，我了解到一些有趣的信息...",
+        "补充一下相关的背景知识：",
+        "这让我想到了一些相关的内容："
+    ),
+    "supportive": (
+        "我理解你的想法，这确实是一个值得考虑的问题。",
+        "你的观点很有意思，我想分享一些相关的想法：",
+        "从另一个角度来看，也许可以这样考虑："
+    ),
+    "creative": (
+        "这激发了我的一些创意想法：",
+        "从创意的角度来看，我们可以这样思考：",
+        "让我分享一个有趣的想法："
+    ),
+    "analytical": (
+        "从分析的角度来看，这个问题有几个维度：",
+        "让我们深入分析一下这个情况：",
+        "数据表明这种现象背后可能有以下原因："
+    )
+}
+
+
+class _TTLCache:
+    """
+    带过期时间和容量上限的回复缓存
+    
+    每个条目独立过期，超出容量时淘汰最久未使用的条目，
+    避免整表定时清空导致的缓存冷启动
+    """
+    
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """获取未过期的缓存值"""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        
+        expires_at, value = item
+        if expires_at <= self.timer():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any):
+        self._data[key] = (self.timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def clear(self):
+        """清空缓存"""
+        self._data.clear()
+
+
 class SmartResponseAction(BaseAction):
     """
     智能回复Action
@@ -85,10 +165,13 @@ class SmartResponseAction(BaseAction):
     associated_types = ["text", "image"]
     
     # ==================== 缓存和性能 ====================
+    # 缓存最大条目数
+    cache_max_size = 256
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._response_cache = {}
-        self._last_cache_clear = time.time()
+        # 过期时间在execute中按配置更新
+        self._response_cache = _TTLCache(maxsize=self.cache_max_size, ttl=3600)
     
     # ==================== 执行逻辑 ====================
     async def execute(self) -> Tuple[bool, str]:
@@ -101,19 +184,22 @@ class SmartResponseAction(BaseAction):
         - 复杂配置处理
         - 智能内容生成
         """
+        # 配置在每次执行中只读取一次，异常处理中复用
+        debug_mode = False
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # 检查功能是否启用
             if not self.get_config("features.enable_smart_responses", True):
                 return False, "智能回复功能已禁用"
             
             # 获取配置
+            debug_mode = self.get_config("plugin.debug_mode", False)
             response_probability = self.get_config("actions.response_probability", 0.1)
             max_response_length = self.get_config("actions.max_response_length", 200)
             cache_enabled = self.get_config("advanced.cache_enabled", True)
+            cache_ttl = self.get_config("advanced.cache_ttl", 3600)
             performance_monitor = self.get_config("advanced.performance_monitor", False)
-            debug_mode = self.get_config("plugin.debug_mode", False)
             
             # 更新随机激活概率（配置驱动）
             self.random_activation_probability = response_probability
@@ -131,20 +217,18 @@ class SmartResponseAction(BaseAction):
                     f"🤖 智能回复：类型={response_type}, 深度={context_depth}, 语调={tone}"
                 )
             
-            # 检查缓存
+            # 检查缓存（过期条目在读取时自动淘汰）
             cache_key = f"{response_type}_{context_depth}_{tone}"
-            if cache_enabled and cache_key in self._response_cache:
-                cached_response = self._response_cache[cache_key]
-                await self.send_text(cached_response)
-                
-                if debug_mode:
-                    await self.send_text("📋 使用了缓存回复")
-                
-                return True, "发送了缓存的智能回复"
-            
-            # 清理过期缓存
             if cache_enabled:
-                await self._cleanup_expired_cache()
+                self._response_cache.ttl = cache_ttl
+                cached_response = self._response_cache.get(cache_key)
+                if cached_response is not None:
+                    # 调试提示与缓存回复合并发送
+                    if debug_mode:
+                        cached_response = f"{cached_response}\n\n📋 使用了缓存回复"
+                    await self.send_text(cached_response)
+                    
+                    return True, "发送了缓存的智能回复"
             
             # 生成智能回复
             smart_response = await self._generate_smart_response(
@@ -174,7 +258,7 @@ class SmartResponseAction(BaseAction):
             
             # 性能监控
             if performance_monitor:
-                execution_time = time.time() - start_time
+                execution_time = time.monotonic() - start_time
                 if execution_time > 2.0:  # 如果执行时间超过2秒
                     await self.send_text(f"⚠️ 性能警告：执行时间 {execution_time:.2f}s")
             
@@ -183,7 +267,7 @@ class SmartResponseAction(BaseAction):
         except Exception as e:
             error_msg = f"智能回复Action执行失败: {str(e)}"
             
-            if self.get_config("plugin.debug_mode", False):
+            if debug_mode:
                 await self.send_text(f"❌ {error_msg}")
             
             return False, error_msg
@@ -196,61 +280,27 @@ class SmartResponseAction(BaseAction):
         
         根据参数生成不同类型的回复
         """
-        # 基础回复模板
-        response_templates = {
-            "informative": [
-                "关于这个话题，我了解到一些有趣的信息...",
-                "补充一下相关的背景知识：",
-                "这让我想到了一些相关的内容："
-            ],
-            "supportive": [
-                "我理解你的想法，这确实是一个值得考虑的问题。",
-                "你的观点很有意思，我想分享一些相关的想法：",
-                "从另一个角度来看，也许可以这样考虑："
-            ],
-            "creative": [
-                "这激发了我的一些创意想法：",
-                "从创意的角度来看，我们可以这样思考：",
-                "让我分享一个有趣的想法："
-            ],
-            "analytical": [
-                "从分析的角度来看，这个问题有几个维度：",
-                "让我们深入分析一下这个情况：",
-                "数据表明这种现象背后可能有以下原因："
-            ]
-        }
-        
         # 选择基础模板
-        templates = response_templates.get(response_type, response_templates["informative"])
+        templates = _RESPONSE_TEMPLATES.get(response_type, _RESPONSE_TEMPLATES["informative"])
         base_response = random.choice(templates)
         
         # 根据语调调整
         if tone == "formal":
             base_response = base_response.replace("我", "本系统").replace("你", "您")
-        elif tone == "casual":
-            base_response += " 😊"
+        
+        # 各部分最后一次性拼接
+        parts = [base_response]
+        if tone == "casual":
+            parts.append(" 😊")
         
         # 添加内容深度
         if context_depth == "deep":
-            base_response += "\n\n深入来看，这个话题涉及多个层面的考虑..."
+            parts.append("\n\n深入来看，这个话题涉及多个层面的考虑...")
         elif context_depth == "medium":
-            base_response += "\n\n这其中有一些重要的要点值得注意。"
+            parts.append("\n\n这其中有一些重要的要点值得注意。")
         
         # 添加示例
         if include_examples:
-            base_response += "\n\n举个例子来说..."
+            parts.append("\n\n举个例子来说...")
         
-        return base_response
-    
-    async def _cleanup_expired_cache(self):
-        """清理过期缓存"""
-        current_time = time.time()
-        cache_ttl = self.get_config("advanced.cache_ttl", 3600)
-        
-        # 每小时清理一次
-        if current_time - self._last_cache_clear > cache_ttl:
-            self._response_cache.clear()
-            self._last_cache_clear = current_time
-            
-            if self.get_config("plugin.debug_mode", False):
-                await self.send_text("🗑️ 已清理过期缓存")
+        return "".join(parts)
@@ -10,10 +10,115 @@
 """
 
 from src.plugin_system import BaseCommand
-from typing import Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
+import ast
 import re
 
 
+# 配置键格式：section.key，模块加载时编译一次
+_CONFIG_KEY_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*$")
+
+# 布尔值的文本表示
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on", "enabled"})
+_FALSE_VALUES = frozenset({"false", "0", "no", "off", "disabled"})
+
+# 支持的日志级别
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR"})
+
+# 配置列表内容固定不变，只构建一次
+_CONFIG_LIST_TEXT = """🔧 **插件配置列表**
+
+📂 **[plugin]** - 插件基本配置
+• `enabled` = True
+• `config_version` = "1.0.0" 
+• `debug_mode` = False
+
+🎛️ **[features]** - 功能开关
+• `enable_greetings` = True
+• `enable_smart_responses` = True
+• `enable_help_command` = True
+• `enable_config_command` = False
+
+⚡ **[actions]** - Action组件配置
+• `greeting_keywords` = ["你好", "hello", "hi", "嗨"]
+• `response_probability` = 0.1
+• `max_response_length` = 200
+• `enable_emoji` = True
+
+💻 **[commands]** - Command组件配置
+• `help_prefix` = "📖"
+• `config_admin_only` = True
+• `command_timeout` = 30
+
+🔬 **[advanced]** - 高级配置
+• `cache_enabled` = True
+• `cache_ttl` = 3600
+• `log_level` = "INFO"
+• `performance_monitor` = False
+
+💡 使用 `/config get <key>` 查看具体配置值
+💡 使用 `/config set <key> <value>` 修改配置"""
+
+
+# ==================== 配置值转换 ====================
+def _to_bool(value: str) -> bool:
+    """转换为布尔值"""
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"无法将 '{value}' 转换为布尔值")
+
+
+def _to_int(value: str) -> int:
+    """转换为整数"""
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"无法将 '{value}' 转换为整数")
+
+
+def _to_float(value: str) -> float:
+    """转换为浮点数"""
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"无法将 '{value}' 转换为浮点数")
+
+
+def _to_list(value: str) -> List[Any]:
+    """转换为列表"""
+    if value.startswith("[") and value.endswith("]"):
+        # 优先按Python字面量解析，正确处理引号内的逗号
+        try:
+            parsed = ast.literal_eval(value)
+        except (ValueError, SyntaxError, TypeError):
+            # 元素未加引号时退回按逗号拆分
+            items = value[1:-1].split(",")
+            return [item.strip().strip('"\'') for item in items if item.strip()]
+        if isinstance(parsed, (list, tuple)):
+            return list(parsed)
+    return [value]
+
+
+# 目标类型 -> 转换函数
+_CONVERTERS: Dict[type, Callable[[str], Any]] = {
+    bool: _to_bool,
+    int: _to_int,
+    float: _to_float,
+    list: _to_list
+}
+
+# 特定键的验证规则
+_VALIDATORS: Dict[str, Callable[[Any], bool]] = {
+    "actions.response_probability": lambda x: isinstance(x, (int, float)) and 0 <= x <= 1,
+    "commands.command_timeout": lambda x: isinstance(x, int) and x > 0,
+    "advanced.cache_ttl": lambda x: isinstance(x, int) and x > 0,
+    "advanced.log_level": lambda x: isinstance(x, str) and x in _LOG_LEVELS
+}
+
+
 class ConfigCommand(BaseCommand):
     """
     配置管理Command
@@ -29,6 +134,9 @@ class ConfigCommand(BaseCommand):
     # 支持：/config list, /config get key, /config set key value
     command_pattern = r"^/config\s+(?P<action>get|set|list|reset)(?:\s+(?P<key>\w+(?:\.\w+)*))?(?:\s+(?P<value>.+))?$"
     
+    # 预编译的命令模式，供需要直接匹配的代码使用
+    _compiled_pattern = re.compile(command_pattern)
+    
     # 命令说明
     command_help = "配置管理命令，支持查看、修改和重置插件配置"
     
@@ -43,6 +151,14 @@ class ConfigCommand(BaseCommand):
     # 拦截消息 - 配置命令应该拦截，避免触发其他组件
     intercept_message = True
     
+    # 操作分发表：操作名 -> 处理方法名，执行时再绑定到实例
+    _action_handlers = {
+        "list": "_handle_list_config",
+        "get": "_handle_get_config",
+        "set": "_handle_set_config",
+        "reset": "_handle_reset_config"
+    }
+    
     # ==================== 执行逻辑 ====================
     async def execute(self) -> Tuple[bool, Optional[str]]:
         """
@@ -90,18 +206,13 @@ class ConfigCommand(BaseCommand):
                 return False, "缺少操作参数"
             
             # 执行不同的配置操作
-            if action == "list":
-                return await self._handle_list_config()
-            elif action == "get":
-                return await self._handle_get_config(key)
-            elif action == "set":
-                return await self._handle_set_config(key, value)
-            elif action == "reset":
-                return await self._handle_reset_config(key)
-            else:
+            handler_name = self._action_handlers.get(action)
+            if handler_name is None:
                 await self.send_text(f"❌ 不支持的操作：{action}")
                 return False, f"不支持的操作：{action}"
             
+            return await getattr(self, handler_name)(key, value)
+            
         except Exception as e:
             error_msg = f"配置命令执行失败: {str(e)}"
             await self.send_text(f"❌ {error_msg}")
@@ -124,50 +235,18 @@ class ConfigCommand(BaseCommand):
         # 在实际实现中，应该有更严格的权限检查
         return current_user in admin_users or current_user == "demo_admin"
     
-    async def _handle_list_config(self) -> Tuple[bool, str]:
+    async def _handle_list_config(self, key: Optional[str] = None,
+                                  value: Optional[str] = None) -> Tuple[bool, str]:
         """处理配置列表命令"""
         try:
-            config_text = """🔧 **插件配置列表**
-
-📂 **[plugin]** - 插件基本配置
-• `enabled` = True
-• `config_version` = "1.0.0" 
-• `debug_mode` = False
-
-🎛️ **[features]** - 功能开关
-• `enable_greetings` = True
-• `enable_smart_responses` = True
-• `enable_help_command` = True
-• `enable_config_command` = False
-
-⚡ **[actions]** - Action组件配置
-• `greeting_keywords` = ["你好", "hello", "hi", "嗨"]
-• `response_probability` = 0.1
-• `max_response_length` = 200
-• `enable_emoji` = True
-
-💻 **[commands]** - Command组件配置
-• `help_prefix` = "📖"
-• `config_admin_only` = True
-• `command_timeout` = 30
-
-🔬 **[advanced]** - 高级配置
-• `cache_enabled` = True
-• `cache_ttl` = 3600
-• `log_level` = "INFO"
-• `performance_monitor` = False
-
-💡 使用 `/config get <key>` 查看具体配置值
-💡 使用 `/config set <key> <value>` 修改配置"""
-            
-            await self.send_text(config_text)
+            await self.send_text(_CONFIG_LIST_TEXT)
             return True, "显示了配置列表"
             
         except Exception as e:
             await self.send_text(f"❌ 获取配置列表失败：{str(e)}")
             return False, f"获取配置列表失败：{e}"
     
-    async def _handle_get_config(self, key: str) -> Tuple[bool, str]:
+    async def _handle_get_config(self, key: str, value: Optional[str] = None) -> Tuple[bool, str]:
         """处理获取配置命令"""
         if not key:
             await self.send_text("❌ 请指定要查询的配置键")
@@ -263,7 +342,7 @@ class ConfigCommand(BaseCommand):
             await self.send_text(f"❌ 设置配置失败：{str(e)}")
             return False, f"设置配置失败：{e}"
     
-    async def _handle_reset_config(self, key: str) -> Tuple[bool, str]:
+    async def _handle_reset_config(self, key: str, value: Optional[str] = None) -> Tuple[bool, str]:
         """处理重置配置命令"""
         if not key:
             await self.send_text("❌ 请指定要重置的配置键")
@@ -307,53 +386,18 @@ class ConfigCommand(BaseCommand):
     def _validate_config_key(self, key: str) -> bool:
         """验证配置键格式"""
         # 配置键应该符合 section.key 的格式
-        pattern = r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*$"
-        return bool(re.match(pattern, key))
+        return _CONFIG_KEY_RE.match(key) is not None
     
     def _convert_config_value(self, value: str, target_type: type):
         """转换配置值类型"""
-        if target_type == bool:
-            if value.lower() in ["true", "1", "yes", "on", "enabled"]:
-                return True
-            elif value.lower() in ["false", "0", "no", "off", "disabled"]:
-                return False
-            else:
-                raise ValueError(f"无法将 '{value}' 转换为布尔值")
-        
-        elif target_type == int:
-            try:
-                return int(value)
-            except ValueError:
-                raise ValueError(f"无法将 '{value}' 转换为整数")
-        
-        elif target_type == float:
-            try:
-                return float(value)
-            except ValueError:
-                raise ValueError(f"无法将 '{value}' 转换为浮点数")
-        
-        elif target_type == list:
-            # 简单的列表解析，实际应该更复杂
-            if value.startswith("[") and value.endswith("]"):
-                items = value[1:-1].split(",")
-                return [item.strip().strip('"\'') for item in items if item.strip()]
-            else:
-                return [value]
-        
-        else:  # str或其他类型
+        converter = _CONVERTERS.get(target_type)
+        if converter is None:  # str或其他类型
             return value
+        return converter(value)
     
     def _validate_config_value(self, key: str, value) -> bool:
         """验证配置值的有效性"""
-        # 特定键的验证规则
-        validation_rules = {
-            "actions.response_probability": lambda x: isinstance(x, (int, float)) and 0 <= x <= 1,
-            "commands.command_timeout": lambda x: isinstance(x, int) and x > 0,
-            "advanced.cache_ttl": lambda x: isinstance(x, int) and x > 0,
-            "advanced.log_level": lambda x: x in ["DEBUG", "INFO", "WARNING", "ERROR"]
-        }
-        
-        if key in validation_rules:
-            return validation_rules[key](value)
-        
-        return True  # 默认通过验证
+        validator = _VALIDATORS.get(key)
+        if validator is None:
+            return True  # 默认通过验证
+        return validator(value)
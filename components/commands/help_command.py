@@ -14,87 +14,11 @@ from typing import Tuple, Optional
 import re
 
 
-class HelpCommand(BaseCommand):
-    """
-    帮助Command
-    
-    遵循官方文档的Command设计原则：
-    - 清晰的正则表达式匹配
-    - 合理的参数捕获
-    - 完善的错误处理
-    - 用户友好的帮助信息
-    """
-    
-    # ==================== 命令匹配配置 ====================
-    # 支持：/help, /help actions, /help commands, /help config
-    command_pattern = r"^/help(?:\s+(?P<topic>actions|commands|config|all))?$"
-    
-    # 命令说明
-    command_help = "显示插件帮助信息，支持查看特定主题"
-    
-    # 使用示例
-    command_examples = [
-        "/help",
-        "/help actions", 
-        "/help commands",
-        "/help config",
-        "/help all"
-    ]
-    
-    # 拦截消息 - 帮助命令应该拦截，避免触发其他组件
-    intercept_message = True
-    
-    # ==================== 执行逻辑 ====================
-    async def execute(self) -> Tuple[bool, Optional[str]]:
-        """
-        执行帮助命令
-        
-        遵循官方文档的最佳实践：
-        - 早期参数验证
-        - 配置驱动的行为
-        - 完整的错误处理
-        - 清晰的返回值
-        """
-        try:
-            # 检查功能是否启用
-            if not self.get_config("features.enable_help_command", True):
-                await self.send_text("❌ 帮助命令功能已禁用")
-                return False, "帮助命令已禁用"
-            
-            # 获取配置
-            help_prefix = self.get_config("commands.help_prefix", "📖")
-            debug_mode = self.get_config("plugin.debug_mode", False)
-            
-            # 获取参数
-            topic = self.matched_groups.get("topic")
-            
-            # 调试信息
-            if debug_mode:
-                await self.send_text(f"🔍 调试：帮助主题={topic}")
-            
-            # 根据主题显示不同的帮助内容
-            if topic == "actions":
-                await self._show_actions_help(help_prefix)
-            elif topic == "commands":
-                await self._show_commands_help(help_prefix)
-            elif topic == "config":
-                await self._show_config_help(help_prefix)
-            elif topic == "all":
-                await self._show_complete_help(help_prefix)
-            else:
-                await self._show_general_help(help_prefix)
-            
-            return True, f"显示了帮助信息，主题：{topic or 'general'}"
-            
-        except Exception as e:
-            error_msg = f"帮助命令执行失败: {str(e)}"
-            await self.send_text(f"❌ {error_msg}")
-            return False, error_msg
-    
-    # ==================== 私有方法 ====================
-    async def _show_general_help(self, prefix: str):
-        """显示通用帮助信息"""
-        help_text = f"""{prefix} **插件帮助**
+# ==================== 帮助文本模板 ====================
+# 只有 {prefix} 是运行时变量，其余内容在模块加载时构建一次
+
+# 通用帮助
+_GENERAL_HELP_TEMPLATE = """{prefix} **插件帮助**
 
 🔌 **插件名称**: Example Template Plugin
 📝 **版本**: 1.0.0
@@ -113,12 +37,9 @@ class HelpCommand(BaseCommand):
 • 配置管理：通过命令调整插件设置
 
 💡 **提示**: 使用 `/help <主题>` 查看详细说明"""
-        
-        await self.send_text(help_text)
-    
-    async def _show_actions_help(self, prefix: str):
-        """显示Action组件帮助"""
-        help_text = f"""{prefix} **Action组件说明**
+
+# Action组件帮助
+_ACTIONS_HELP_TEMPLATE = """{prefix} **Action组件说明**
 
 ⚡ **Action是什么？**
 Action是智能组件，由麦麦根据对话情境自主选择使用，具有随机性和拟人化特点。
@@ -140,12 +61,9 @@ Action是智能组件，由麦麦根据对话情境自主选择使用，具有
 • `features.enable_smart_responses` - 启用/禁用智能回复
 • `actions.greeting_keywords` - 自定义问候关键词
 • `actions.response_probability` - 智能回复激活概率"""
-        
-        await self.send_text(help_text)
-    
-    async def _show_commands_help(self, prefix: str):
-        """显示Command组件帮助"""
-        help_text = f"""{prefix} **Command组件说明**
+
+# Command组件帮助
+_COMMANDS_HELP_TEMPLATE = """{prefix} **Command组件说明**
 
 💻 **Command是什么？**
 Command是直接响应用户指令的组件，通过正则表达式匹配用户输入，提供确定性功能。
@@ -167,12 +85,9 @@ Command是直接响应用户指令的组件，通过正则表达式匹配用户
 • `features.enable_config_command` - 启用/禁用配置命令
 • `commands.help_prefix` - 帮助消息前缀
 • `commands.config_admin_only` - 配置命令仅限管理员"""
-        
-        await self.send_text(help_text)
-    
-    async def _show_config_help(self, prefix: str):
-        """显示配置说明"""
-        help_text = f"""{prefix} **配置说明**
+
+# 配置说明
+_CONFIG_HELP_TEMPLATE = """{prefix} **配置说明**
 
 ⚙️ **配置原则**:
 本插件采用Schema驱动的配置系统，配置文件会自动生成，请勿手动创建！
@@ -210,22 +125,9 @@ Command是直接响应用户指令的组件，通过正则表达式匹配用户
 🔧 **修改配置**:
 配置文件位置：`plugins/example_template_plugin/config.toml`
 修改后需要重启插件生效。"""
-        
-        await self.send_text(help_text)
-    
-    async def _show_complete_help(self, prefix: str):
-        """显示完整帮助信息"""
-        await self.send_text(f"{prefix} **完整帮助信息**")
-        await self.send_text("正在加载完整帮助...")
-        
-        # 显示所有帮助内容
-        await self._show_general_help("📖")
-        await self._show_actions_help("⚡")  
-        await self._show_commands_help("💻")
-        await self._show_config_help("⚙️")
-        
-        # 添加额外信息
-        extra_text = f"""{prefix} **额外信息**
+
+# 完整帮助的额外信息
+_EXTRA_HELP_TEMPLATE = """{prefix} **额外信息**
 
 🔗 **相关链接**:
 • 官方文档：https://docs.mai-mai.org/
@@ -244,5 +146,122 @@ Command是直接响应用户指令的组件，通过正则表达式匹配用户
 4. 合理使用调试模式
 
 感谢使用 MaiBot 插件系统！"""
+
+
+class HelpCommand(BaseCommand):
+    """
+    帮助Command
+    
+    遵循官方文档的Command设计原则：
+    - 清晰的正则表达式匹配
+    - 合理的参数捕获
+    - 完善的错误处理
+    - 用户友好的帮助信息
+    """
+    
+    # ==================== 命令匹配配置 ====================
+    # 支持：/help, /help actions, /help commands, /help config
+    command_pattern = r"^/help(?:\s+(?P<topic>actions|commands|config|all))?$"
+    
+    # 预编译的命令模式，供需要直接匹配的代码使用
+    _compiled_pattern = re.compile(command_pattern)
+    
+    # 命令说明
+    command_help = "显示插件帮助信息，支持查看特定主题"
+    
+    # 使用示例
+    command_examples = [
+        "/help",
+        "/help actions", 
+        "/help commands",
+        "/help config",
+        "/help all"
+    ]
+    
+    # 拦截消息 - 帮助命令应该拦截，避免触发其他组件
+    intercept_message = True
+    
+    # 主题分发表：主题 -> 处理方法名，未知主题显示通用帮助
+    _topic_handlers = {
+        "actions": "_show_actions_help",
+        "commands": "_show_commands_help",
+        "config": "_show_config_help",
+        "all": "_show_complete_help"
+    }
+    
+    # ==================== 执行逻辑 ====================
+    async def execute(self) -> Tuple[bool, Optional[str]]:
+        """
+        执行帮助命令
+        
+        遵循官方文档的最佳实践：
+        - 早期参数验证
+        - 配置驱动的行为
+        - 完整的错误处理
+        - 清晰的返回值
+        """
+        try:
+            # 检查功能是否启用
+            if not self.get_config("features.enable_help_command", True):
+                await self.send_text("❌ 帮助命令功能已禁用")
+                return False, "帮助命令已禁用"
+            
+            # 获取配置
+            help_prefix = self.get_config("commands.help_prefix", "📖")
+            debug_mode = self.get_config("plugin.debug_mode", False)
+            
+            # 获取参数（裸 /help 没有捕获组，直接走通用帮助）
+            topic = self.matched_groups.get("topic") if self.matched_groups else None
+            
+            # 调试信息
+            if debug_mode:
+                await self.send_text(f"🔍 调试：帮助主题={topic}")
+            
+            # 根据主题显示不同的帮助内容
+            handler_name = self._topic_handlers.get(topic, "_show_general_help")
+            await getattr(self, handler_name)(help_prefix)
+            
+            return True, f"显示了帮助信息，主题：{topic or 'general'}"
+            
+        except Exception as e:
+            error_msg = f"帮助命令执行失败: {str(e)}"
+            await self.send_text(f"❌ {error_msg}")
+            return False, error_msg
+    
+    # ==================== 私有方法 ====================
+    async def _show_general_help(self, prefix: str):
+        """显示通用帮助信息"""
+        help_text = _GENERAL_HELP_TEMPLATE.format(prefix=prefix)
+        
+        await self.send_text(help_text)
+    
+    async def _show_actions_help(self, prefix: str):
+        """显示Action组件帮助"""
+        help_text = _ACTIONS_HELP_TEMPLATE.format(prefix=prefix)
+        
+        await self.send_text(help_text)
+    
+    async def _show_commands_help(self, prefix: str):
+        """显示Command组件帮助"""
+        help_text = _COMMANDS_HELP_TEMPLATE.format(prefix=prefix)
+        
+        await self.send_text(help_text)
+    
+    async def _show_config_help(self, prefix: str):
+        """显示配置说明"""
+        help_text = _CONFIG_HELP_TEMPLATE.format(prefix=prefix)
+        
+        await self.send_text(help_text)
+    
+    async def _show_complete_help(self, prefix: str):
+        """显示完整帮助信息（合并为一条消息发送）"""
+        complete_text = "\n\n".join((
+            f"{prefix} **完整帮助信息**",
+            _GENERAL_HELP_TEMPLATE.format(prefix="📖"),
+            _ACTIONS_HELP_TEMPLATE.format(prefix="⚡"),
+            _COMMANDS_HELP_TEMPLATE.format(prefix="💻"),
+            _CONFIG_HELP_TEMPLATE.format(prefix="⚙️"),
+            _EXTRA_HELP_TEMPLATE.format(prefix=prefix)
+        ))
         
-        await self.send_text(extra_text)
+        await self.send_text(complete_text)
@@ -179,27 +179,30 @@ class ExampleTemplatePlugin(BasePlugin):
         if not self.get_config("plugin.enabled", True):
             return components
         
+        # 功能开关整节读取一次，后续均为本地字典查询
+        features = self.get_config("features", {})
+        
         # 根据配置注册Action组件
-        if self.get_config("features.enable_greetings", True):
+        if features.get("enable_greetings", True):
             components.append((
                 GreetingAction.get_action_info(), 
                 GreetingAction
             ))
         
-        if self.get_config("features.enable_smart_responses", True):
+        if features.get("enable_smart_responses", True):
             components.append((
                 SmartResponseAction.get_action_info(), 
                 SmartResponseAction
             ))
         
         # 根据配置注册Command组件
-        if self.get_config("features.enable_help_command", True):
+        if features.get("enable_help_command", True):
             components.append((
                 HelpCommand.get_command_info(), 
                 HelpCommand
             ))
         
-        if self.get_config("features.enable_config_command", False):
+        if features.get("enable_config_command", False):
             components.append((
                 ConfigCommand.get_command_info(), 
                 ConfigCommand
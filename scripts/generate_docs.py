@@ -7,26 +7,32 @@
 import ast
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 
+@lru_cache(maxsize=512)
+def _parse_cached(file_path: str, mtime_ns: int) -> ast.Module:
+    """解析Python文件，修改时间作为缓存键的一部分，文件变化后自动重新解析"""
+    # 以字节读取，编码声明和BOM由ast.parse处理
+    return ast.parse(Path(file_path).read_bytes())
+
 def extract_docstrings(file_path: str) -> Dict[str, str]:
     """从Python文件中提取类和函数的文档字符串"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        tree = ast.parse(content)
+        tree = _parse_cached(file_path, os.stat(file_path).st_mtime_ns)
         docstrings = {}
         
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
-                if node.body and isinstance(node.body[0], ast.Expr):
-                    if isinstance(node.body[0].value, ast.Str):
-                        docstrings[node.name] = node.body[0].value.s
-                    elif isinstance(node.body[0].value, ast.Constant) and isinstance(node.body[0].value.value, str):
-                        docstrings[node.name] = node.body[0].value.value
+        def visit(node: ast.AST):
+            # 文档字符串只可能出现在类和函数定义中，无需遍历表达式节点
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                    docstring = ast.get_docstring(child, clean=False)
+                    if docstring:
+                        docstrings[child.name] = docstring
+                    visit(child)
         
+        visit(tree)
         return docstrings
     except Exception as e:
         print(f"⚠️  无法解析 {file_path}: {e}")
@@ -48,14 +54,20 @@ def generate_component_docs(components_dir: str) -> str:
         
         docs.append(f"## {comp_type.title()}\n")
         
-        for py_file in comp_dir.glob("*.py"):
-            if py_file.name == "__init__.py":
-                continue
-            
-            docs.append(f"### {py_file.stem}\n")
+        # 单次目录扫描获取文件列表，按文件名排序保证输出稳定
+        with os.scandir(comp_dir) as entries:
+            py_files = sorted(
+                (entry for entry in entries
+                 if entry.name.endswith(".py") and entry.name != "__init__.py"
+                 and entry.is_file()),
+                key=lambda entry: entry.name
+            )
+        
+        for py_file in py_files:
+            docs.append(f"### {Path(py_file.name).stem}\n")
             
             # 提取文档字符串
-            docstrings = extract_docstrings(str(py_file))
+            docstrings = extract_docstrings(py_file.path)
             
             if docstrings:
                 for name, docstring in docstrings.items():
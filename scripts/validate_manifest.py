@@ -4,47 +4,102 @@ MaiBot插件Manifest验证脚本
 严格按照官方文档规范验证_manifest.json的完整性和正确性
 """
 
+import codecs
+import functools
 import json
 import os
 import sys
 from typing import Dict, Any, List, Optional
 import re
+from urllib.parse import urlsplit
+
+# 可选依赖：安装了orjson时使用更快的解析器，否则回退到标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# ==================== 预编译的正则表达式 ====================
+# 版本号格式 x.y.z
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+
+# 本地化代码格式 xx 或 xx-XX
+_LOCALE_RE = re.compile(r'^[a-z]{2}(-[A-Z]{2})?$')
+
+# ==================== 合法取值 ====================
+_VALID_PLUGIN_TYPES = frozenset({'general', 'game', 'utility', 'entertainment', 'social', 'productivity'})
+_VALID_COMPONENT_TYPES = frozenset({'action', 'command', 'tool'})
+
+# 顶层的可选URL字段
+_URL_FIELDS = ('homepage_url', 'repository_url')
+
+
+@functools.lru_cache(maxsize=256)
+def _is_valid_url(url: str) -> bool:
+    """简单的URL格式验证：结构化解析，只检查协议和主机"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme in ('http', 'https') and bool(parts.netloc)
 
 
 class ManifestValidator:
     """MaiBot插件manifest.json验证器"""
     
+    __slots__ = ('manifest_path', '_manifest_dir', 'errors', 'warnings', 'manifest', '_fatal')
+    
     def __init__(self, manifest_path: str):
         self.manifest_path = manifest_path
+        self._manifest_dir = os.path.dirname(manifest_path)
         self.errors: List[str] = []
         self.warnings: List[str] = []
-        
+        # 出现致命错误时跳过后续检查，避免产生连锁的误导性错误
+        self._fatal = False
+    
     def validate(self) -> bool:
         """验证manifest文件"""
         try:
-            with open(self.manifest_path, 'r', encoding='utf-8') as f:
-                self.manifest = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            # 以字节读取，跳过文本层解码；json.loads与orjson.loads都接受UTF-8字节
+            with open(self.manifest_path, 'rb') as f:
+                data = f.read()
+            # 不接受UTF-8 BOM，无论使用哪个JSON解析器都明确拒绝
+            if data.startswith(codecs.BOM_UTF8):
+                raise ValueError("文件以UTF-8 BOM开头，请以无BOM的UTF-8保存")
+            # manifest顶层必须是对象，首个非空白字节不是 { 时无需完整解析
+            if not data.lstrip().startswith(b'{'):
+                raise ValueError("顶层必须是JSON对象")
+            self.manifest = _json_loads(data)
+        except (FileNotFoundError, ValueError) as e:
             self.errors.append(f"无法读取manifest文件: {e}")
             return False
+        
+        manifest = self.manifest
             
-        # 按官方文档验证各个字段
-        self._validate_manifest_version()
+        # 结构性检查，失败则直接返回
+        self._validate_manifest_version(manifest.get('manifest_version'))
         self._validate_basic_info()
-        self._validate_author()
+        if self.errors and self._fatal:
+            return False
+        
+        # 按官方文档验证各个字段
+        self._validate_author(manifest.get('author'))
         self._validate_urls()
-        self._validate_keywords_categories()
-        self._validate_host_application()
-        self._validate_locales()
-        self._validate_plugin_info()
+        self._validate_keywords_categories(manifest.get('keywords', []), manifest.get('categories', []))
+        self._validate_host_application(manifest.get('host_application'))
+        if 'default_locale' in manifest or 'locales_path' in manifest:
+            self._validate_locales(manifest.get('default_locale'), manifest.get('locales_path'))
+        self._validate_plugin_info(manifest.get('plugin_info'))
         
         return len(self.errors) == 0
     
-    def _validate_manifest_version(self):
-        """验证manifest版本"""
-        version = self.manifest.get('manifest_version')
+    def _validate_manifest_version(self, version: Any):
+        """验证manifest版本，版本不符时无法按当前规范解析，视为致命错误"""
         if version != 3:
             self.errors.append(f"manifest_version必须为3，当前为: {version}")
+            self._fatal = True
     
     def _validate_basic_info(self):
         """验证基本信息字段"""
@@ -58,12 +113,11 @@ class ManifestValidator:
         
         # 验证版本格式
         version = self.manifest.get('version', '')
-        if not re.match(r'^\d+\.\d+\.\d+$', version):
+        if not _SEMVER_RE.match(version):
             self.errors.append(f"版本号格式无效: {version}，应为 x.y.z 格式")
     
-    def _validate_author(self):
+    def _validate_author(self, author: Any):
         """验证作者信息"""
-        author = self.manifest.get('author')
         if not author or not isinstance(author, dict):
             self.errors.append("author字段必须是对象")
             return
@@ -72,34 +126,35 @@ class ManifestValidator:
             self.errors.append("author.name是必填字段")
         
         url = author.get('url')
-        if url and not self._is_valid_url(url):
+        if url and not _is_valid_url(url):
             self.warnings.append(f"author.url格式可能无效: {url}")
     
     def _validate_urls(self):
         """验证URL字段"""
-        url_fields = ['homepage_url', 'repository_url']
-        for field in url_fields:
-            url = self.manifest.get(field)
-            if url and not self._is_valid_url(url):
+        manifest = self.manifest
+        # 常见情况下两个字段都未填写，直接跳过
+        if 'homepage_url' not in manifest and 'repository_url' not in manifest:
+            return
+        
+        for field in _URL_FIELDS:
+            url = manifest.get(field)
+            if url and not _is_valid_url(url):
                 self.warnings.append(f"{field}格式可能无效: {url}")
     
-    def _validate_keywords_categories(self):
+    def _validate_keywords_categories(self, keywords: Any, categories: Any):
         """验证关键词和分类"""
-        keywords = self.manifest.get('keywords', [])
         if not isinstance(keywords, list):
             self.errors.append("keywords必须是数组")
         elif len(keywords) == 0:
             self.warnings.append("建议添加keywords以提高插件可发现性")
         
-        categories = self.manifest.get('categories', [])
         if not isinstance(categories, list):
             self.errors.append("categories必须是数组")
         elif len(categories) == 0:
             self.warnings.append("建议添加categories以分类插件")
     
-    def _validate_host_application(self):
+    def _validate_host_application(self, host_app: Any):
         """验证宿主应用要求"""
-        host_app = self.manifest.get('host_application')
         if not host_app or not isinstance(host_app, dict):
             self.warnings.append("建议指定host_application版本要求")
             return
@@ -107,27 +162,24 @@ class ManifestValidator:
         min_version = host_app.get('min_version')
         max_version = host_app.get('max_version')
         
-        if min_version and not re.match(r'^\d+\.\d+\.\d+$', min_version):
+        if min_version and not _SEMVER_RE.match(min_version):
             self.errors.append(f"min_version格式无效: {min_version}")
         
-        if max_version and not re.match(r'^\d+\.\d+\.\d+$', max_version):
+        if max_version and not _SEMVER_RE.match(max_version):
             self.errors.append(f"max_version格式无效: {max_version}")
     
-    def _validate_locales(self):
+    def _validate_locales(self, default_locale: Any, locales_path: Any):
         """验证本地化设置"""
-        default_locale = self.manifest.get('default_locale')
-        if default_locale and not re.match(r'^[a-z]{2}(-[A-Z]{2})?$', default_locale):
+        if default_locale and not _LOCALE_RE.match(default_locale):
             self.warnings.append(f"default_locale格式建议为 'xx' 或 'xx-XX': {default_locale}")
         
-        locales_path = self.manifest.get('locales_path')
         if locales_path:
-            full_path = os.path.join(os.path.dirname(self.manifest_path), locales_path)
+            full_path = os.path.join(self._manifest_dir, locales_path)
             if not os.path.exists(full_path):
                 self.warnings.append(f"本地化目录不存在: {locales_path}")
     
-    def _validate_plugin_info(self):
+    def _validate_plugin_info(self, plugin_info: Any):
         """验证插件信息"""
-        plugin_info = self.manifest.get('plugin_info')
         if not plugin_info or not isinstance(plugin_info, dict):
             self.errors.append("plugin_info字段是必需的")
             return
@@ -138,9 +190,8 @@ class ManifestValidator:
             self.errors.append("plugin_info.is_built_in必须是布尔值")
         
         plugin_type = plugin_info.get('plugin_type')
-        valid_types = ['general', 'game', 'utility', 'entertainment', 'social', 'productivity']
-        if plugin_type not in valid_types:
-            self.warnings.append(f"plugin_type建议使用标准值: {valid_types}")
+        if plugin_type not in _VALID_PLUGIN_TYPES:
+            self.warnings.append(f"plugin_type建议使用标准值: {sorted(_VALID_PLUGIN_TYPES)}")
         
         # 验证组件信息
         components = plugin_info.get('components', [])
@@ -154,34 +205,27 @@ class ManifestValidator:
         if len(components) == 0:
             self.warnings.append("插件没有定义任何组件")
         
+        # 循环内频繁调用，提前绑定为局部变量
+        errors_append = self.errors.append
+        warnings_append = self.warnings.append
+        
         for i, component in enumerate(components):
+            prefix = f"组件{i}"
             if not isinstance(component, dict):
-                self.errors.append(f"组件{i}必须是对象")
+                errors_append(prefix + "必须是对象")
                 continue
             
             comp_type = component.get('type')
-            comp_name = component.get('name')
-            comp_desc = component.get('description')
-            
-            if comp_type not in ['action', 'command', 'tool']:
-                self.errors.append(f"组件{i}类型无效: {comp_type}")
+            if comp_type not in _VALID_COMPONENT_TYPES:
+                errors_append(f"{prefix}类型无效: {comp_type}")
             
+            comp_name = component.get('name')
             if not comp_name or not isinstance(comp_name, str):
-                self.errors.append(f"组件{i}缺少有效的name字段")
+                errors_append(prefix + "缺少有效的name字段")
             
+            comp_desc = component.get('description')
             if not comp_desc or not isinstance(comp_desc, str):
-                self.warnings.append(f"组件{i}建议添加description字段")
-    
-    def _is_valid_url(self, url: str) -> bool:
-        """简单的URL格式验证"""
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return url_pattern.match(url) is not None
+                warnings_append(prefix + "建议添加description字段")
     
     def print_results(self):
         """打印验证结果"""
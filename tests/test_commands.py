@@ -9,20 +9,66 @@ Command组件测试
 """
 
 import unittest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import create_autospec, patch
+import re
 import sys
 import os
 
-# 添加插件路径到Python路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 添加插件路径到Python路径（已存在时不重复添加）
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from components.commands.help_command import HelpCommand
 from components.commands.config_command import ConfigCommand
 
+# 帮助命令的匹配用例
+_VALID_HELP = (
+    "/help",
+    "/help actions",
+    "/help commands",
+    "/help config",
+    "/help all",
+)
+_INVALID_HELP = (
+    "help",                 # 缺少斜杠
+    "/help invalid",        # 无效主题
+    "/help actions extra",  # 额外参数
+    "/HELP",                # 大小写不匹配
+)
 
-class TestHelpCommand(unittest.TestCase):
+# 配置键验证用例
+_VALID_KEYS = (
+    "plugin.enabled",
+    "features.enable_greetings",
+    "actions.greeting_keywords",
+    "advanced.cache_enabled",
+)
+_INVALID_KEYS = (
+    "123invalid",       # 以数字开头
+    "plugin..enabled",  # 双点
+    "plugin.",          # 以点结尾
+    ".plugin",          # 以点开头
+    "plugin-enabled",   # 包含连字符
+)
+
+# 配置命令的匹配用例：(命令, 期望的捕获组)
+_CFG_CASES = (
+    ("/config list", {"action": "list", "key": None, "value": None}),
+    ("/config get plugin.enabled", {"action": "get", "key": "plugin.enabled", "value": None}),
+    ("/config set debug_mode true", {"action": "set", "key": "debug_mode", "value": "true"}),
+    ("/config reset features.greetings", {"action": "reset", "key": "features.greetings", "value": None}),
+)
+
+
+class TestHelpCommand(unittest.IsolatedAsyncioTestCase):
     """帮助Command测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """构建一次带签名校验的模拟对象，各测试共用"""
+        cls._spec = create_autospec(HelpCommand, instance=True)
+    
     def setUp(self):
         """测试前的设置"""
         self.command = HelpCommand()
@@ -34,17 +80,14 @@ class TestHelpCommand(unittest.TestCase):
             "plugin.debug_mode": False
         }
         
-        # 模拟方法
-        self.command.get_config = Mock(side_effect=self._mock_get_config)
-        self.command.send_text = AsyncMock()
+        # 模拟方法（dict.get与get_config签名一致，无需Mock包装）
+        self.command.get_config = self.mock_config.get
+        self.command.send_text = self._spec.send_text
+        self.command.send_text.reset_mock()
         
         # 模拟matched_groups
         self.command.matched_groups = {}
     
-    def _mock_get_config(self, key, default=None):
-        """模拟配置获取"""
-        return self.mock_config.get(key, default)
-    
     def test_command_basic_properties(self):
         """测试Command基本属性"""
         self.assertIsNotNone(self.command.command_pattern)
@@ -54,33 +97,17 @@ class TestHelpCommand(unittest.TestCase):
     
     def test_command_pattern_matching(self):
         """测试命令模式匹配"""
-        import re
-        pattern = self.command.command_pattern
+        pattern = self.command._compiled_pattern
         
         # 测试有效匹配
-        valid_commands = [
-            "/help",
-            "/help actions",
-            "/help commands", 
-            "/help config",
-            "/help all"
-        ]
-        
-        for cmd in valid_commands:
-            match = re.match(pattern, cmd)
-            self.assertIsNotNone(match, f"命令 '{cmd}' 应该匹配")
+        for cmd in _VALID_HELP:
+            with self.subTest(cmd=cmd):
+                self.assertIsNotNone(pattern.match(cmd), f"命令 '{cmd}' 应该匹配")
         
         # 测试无效匹配
-        invalid_commands = [
-            "help",           # 缺少斜杠
-            "/help invalid",  # 无效主题
-            "/help actions extra",  # 额外参数
-            "/HELP",          # 大小写不匹配
-        ]
-        
-        for cmd in invalid_commands:
-            match = re.match(pattern, cmd)
-            self.assertIsNone(match, f"命令 '{cmd}' 不应该匹配")
+        for cmd in _INVALID_HELP:
+            with self.subTest(cmd=cmd):
+                self.assertIsNone(pattern.match(cmd), f"命令 '{cmd}' 不应该匹配")
     
     async def test_execute_general_help(self):
         """测试显示通用帮助"""
@@ -147,15 +174,17 @@ class TestHelpCommand(unittest.TestCase):
         self.assertTrue(success)
         self.assertIn("all", message)
         
-        # 验证调用了多次send_text（显示完整帮助）
-        self.assertGreater(self.command.send_text.call_count, 1)
+        # 完整帮助合并为一条消息发送
+        self.assertEqual(self.command.send_text.call_count, 1)
+        sent_text = self.command.send_text.call_args[0][0]
+        self.assertIn("插件帮助", sent_text)
+        self.assertIn("配置说明", sent_text)
     
     async def test_execute_disabled(self):
         """测试功能禁用时的执行"""
-        # 禁用帮助命令功能
-        self.mock_config["features.enable_help_command"] = False
-        
-        success, message = await self.command.execute()
+        # 禁用帮助命令功能（仅在本代码块内生效）
+        with patch.dict(self.mock_config, {"features.enable_help_command": False}):
+            success, message = await self.command.execute()
         
         # 应该返回失败
         self.assertFalse(success)
@@ -163,23 +192,29 @@ class TestHelpCommand(unittest.TestCase):
     
     async def test_execute_with_debug(self):
         """测试调试模式下的执行"""
-        # 启用调试模式
-        self.mock_config["plugin.debug_mode"] = True
+        # 启用调试模式（仅在本代码块内生效）
         self.command.matched_groups = {"topic": "actions"}
         
-        success, message = await self.command.execute()
+        with patch.dict(self.mock_config, {"plugin.debug_mode": True}):
+            success, message = await self.command.execute()
         
         self.assertTrue(success)
         
         # 验证发送了调试信息
-        call_args = [call[0][0] for call in self.command.send_text.call_args_list]
-        debug_messages = [msg for msg in call_args if "调试" in msg]
-        self.assertGreater(len(debug_messages), 0)
+        self.assertTrue(
+            any("调试" in c.args[0] for c in self.command.send_text.call_args_list),
+            "应该发送调试信息"
+        )
 
 
-class TestConfigCommand(unittest.TestCase):
+class TestConfigCommand(unittest.IsolatedAsyncioTestCase):
     """配置Command测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """构建一次带签名校验的模拟对象，各测试共用"""
+        cls._spec = create_autospec(ConfigCommand, instance=True)
+    
     def setUp(self):
         """测试前的设置"""
         self.command = ConfigCommand()
@@ -191,39 +226,26 @@ class TestConfigCommand(unittest.TestCase):
             "plugin.debug_mode": False
         }
         
-        # 模拟方法
-        self.command.get_config = Mock(side_effect=self._mock_get_config)
-        self.command.send_text = AsyncMock()
+        # 模拟方法（dict.get与get_config签名一致，无需Mock包装）
+        self.command.get_config = self.mock_config.get
+        self.command.send_text = self._spec.send_text
+        self.command.send_text.reset_mock()
         self.command.user_id = "test_user"
         
         # 模拟matched_groups
         self.command.matched_groups = {}
     
-    def _mock_get_config(self, key, default=None):
-        """模拟配置获取"""
-        return self.mock_config.get(key, default)
-    
     def test_command_pattern_matching(self):
         """测试复杂的命令模式匹配"""
-        import re
-        pattern = self.command.command_pattern
+        pattern = self.command._compiled_pattern
         
         # 测试有效匹配
-        test_cases = [
-            ("/config list", {"action": "list", "key": None, "value": None}),
-            ("/config get plugin.enabled", {"action": "get", "key": "plugin.enabled", "value": None}),
-            ("/config set debug_mode true", {"action": "set", "key": "debug_mode", "value": "true"}),
-            ("/config reset features.greetings", {"action": "reset", "key": "features.greetings", "value": None})
-        ]
-        
-        for cmd, expected_groups in test_cases:
-            match = re.match(pattern, cmd)
-            self.assertIsNotNone(match, f"命令 '{cmd}' 应该匹配")
-            
-            groups = match.groupdict()
-            for key, expected_value in expected_groups.items():
-                self.assertEqual(groups.get(key), expected_value,
-                               f"命令 '{cmd}' 的参数 {key} 应该是 {expected_value}")
+        for cmd, expected_groups in _CFG_CASES:
+            with self.subTest(cmd=cmd):
+                match = pattern.match(cmd)
+                self.assertIsNotNone(match, f"命令 '{cmd}' 应该匹配")
+                self.assertEqual(match.groupdict(), expected_groups,
+                                 f"命令 '{cmd}' 的捕获参数不正确")
     
     async def test_execute_list_config(self):
         """测试列出配置"""
@@ -314,27 +336,12 @@ class TestConfigCommand(unittest.TestCase):
     def test_validate_config_key(self):
         """测试配置键验证"""
         # 有效的配置键
-        valid_keys = [
-            "plugin.enabled",
-            "features.enable_greetings",
-            "actions.greeting_keywords",
-            "advanced.cache_enabled"
-        ]
-        
-        for key in valid_keys:
+        for key in _VALID_KEYS:
             self.assertTrue(self.command._validate_config_key(key),
                            f"配置键 '{key}' 应该有效")
         
         # 无效的配置键
-        invalid_keys = [
-            "123invalid",      # 以数字开头
-            "plugin..enabled", # 双点
-            "plugin.",         # 以点结尾
-            ".plugin",         # 以点开头
-            "plugin-enabled"   # 包含连字符
-        ]
-        
-        for key in invalid_keys:
+        for key in _INVALID_KEYS:
             self.assertFalse(self.command._validate_config_key(key),
                             f"配置键 '{key}' 应该无效")
     
@@ -367,6 +374,14 @@ class TestConfigCommand(unittest.TestCase):
         result = self.command._convert_config_value('["a", "b", "c"]', list)
         self.assertEqual(result, ["a", "b", "c"])
         
+        # 引号内包含逗号
+        result = self.command._convert_config_value('["a,b", "c"]', list)
+        self.assertEqual(result, ["a,b", "c"])
+        
+        # 元素未加引号
+        result = self.command._convert_config_value("[a, b]", list)
+        self.assertEqual(result, ["a", "b"])
+        
         # 单个值
         result = self.command._convert_config_value("single", list)
         self.assertEqual(result, ["single"])
@@ -388,42 +403,40 @@ class TestConfigCommand(unittest.TestCase):
         self.assertFalse(
             self.command._validate_config_value("advanced.log_level", "INVALID")
         )
+        # 不可哈希的值（如列表）应判为无效而不是抛出异常
+        self.assertFalse(
+            self.command._validate_config_value("advanced.log_level", ["INFO"])
+        )
 
 
 class TestCommandIntegration(unittest.TestCase):
     """Command集成测试"""
     
+    @classmethod
+    def setUpClass(cls):
+        """所有测试共用的命令实例及其模式、示例"""
+        cls._command_specs = [
+            (command.__class__.__name__, command.command_pattern,
+             command._compiled_pattern, command.command_examples)
+            for command in (HelpCommand(), ConfigCommand())
+        ]
+    
     def test_command_pattern_compilation(self):
         """测试命令模式编译"""
-        from components.commands.help_command import HelpCommand
-        from components.commands.config_command import ConfigCommand
-        
-        commands = [HelpCommand(), ConfigCommand()]
-        
-        for command in commands:
-            # 模式应该能够编译
-            import re
-            try:
-                re.compile(command.command_pattern)
-            except re.error as e:
-                self.fail(f"命令 {command.__class__.__name__} 的正则模式无效: {e}")
+        for name, raw_pattern, compiled, _ in self._command_specs:
+            # 预编译的模式应与command_pattern一致
+            self.assertIsInstance(compiled, re.Pattern)
+            self.assertEqual(compiled.pattern, raw_pattern,
+                f"命令 {name} 的预编译模式与command_pattern不一致")
     
     def test_command_examples_validity(self):
         """测试命令示例的有效性"""
-        from components.commands.help_command import HelpCommand
-        from components.commands.config_command import ConfigCommand
-        
-        commands = [HelpCommand(), ConfigCommand()]
-        
-        for command in commands:
-            import re
-            pattern = command.command_pattern
-            
+        for name, _, pattern, examples in self._command_specs:
             # 所有示例都应该匹配模式
-            for example in command.command_examples:
-                match = re.match(pattern, example)
+            for example in examples:
+                match = pattern.match(example)
                 self.assertIsNotNone(match,
-                    f"命令 {command.__class__.__name__} 的示例 '{example}' 不匹配模式")
+                    f"命令 {name} 的示例 '{example}' 不匹配模式")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,226 @@
+"""
+辅助工具测试
+
+测试utils.helpers中的通用工具：
+- 版本号解析与比较
+- 输入清理与关键词提取
+- 字典深度合并
+- 性能监控
+"""
+
+import unittest
+import sys
+import os
+
+# 添加插件路径到Python路径（已存在时不重复添加）
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from utils.helpers import (
+    PerformanceMonitor,
+    compare_versions,
+    deep_merge_dict,
+    extract_keywords,
+    parse_version,
+    sanitize_input,
+)
+
+# 版本号解析用例：(输入, 期望结果)
+_VERSION_CASES = (
+    ("1.2.3", (1, 2, 3)),
+    ("v1.2.3", (1, 2, 3)),
+    ("1.2", (1, 2, 0)),
+    ("1", (1, 0, 0)),
+    ("10.20.30.40", (10, 20, 30)),
+    # 非规范版本号：取前导的数字段，其余忽略
+    ("1.2.3-beta2", (1, 2, 3)),
+    ("1..2", (1, 0, 0)),
+    ("", (0, 0, 0)),
+    ("abc", (0, 0, 0)),
+)
+
+
+class TestVersionHelpers(unittest.TestCase):
+    """版本号工具测试类"""
+
+    def test_parse_version(self):
+        """测试版本号解析"""
+        for version, expected in _VERSION_CASES:
+            with self.subTest(version=version):
+                self.assertEqual(parse_version(version), expected)
+
+    def test_compare_versions(self):
+        """测试版本号比较"""
+        self.assertEqual(compare_versions("1.2.3", "1.2.3"), 0)
+        self.assertEqual(compare_versions("1.2.3", "1.2.4"), -1)
+        self.assertEqual(compare_versions("1.10.0", "1.9.0"), 1)
+        self.assertEqual(compare_versions("2.0", "1.99.99"), 1)
+        self.assertEqual(compare_versions("v1.2", "1.2.0"), 0)
+        self.assertEqual(compare_versions("1.2.3-beta2", "1.2.3"), 0)
+
+
+class TestSanitizeInput(unittest.TestCase):
+    """sanitize_input测试类"""
+
+    def test_empty_input(self):
+        """测试空输入"""
+        self.assertEqual(sanitize_input(""), "")
+
+    def test_plain_text(self):
+        """测试普通文本只去除首尾空白"""
+        self.assertEqual(sanitize_input("  hello world  "), "hello world")
+
+    def test_remove_control_chars(self):
+        """测试移除控制字符"""
+        self.assertEqual(sanitize_input("a\x00b\tc\nd\re\x1ff"), "abcdef")
+        self.assertEqual(sanitize_input("\n  hello \n"), "hello")
+
+    def test_remove_unsafe_symbols(self):
+        """测试移除尖括号和引号"""
+        self.assertEqual(sanitize_input("<b>bold</b>"), "bbold/b")
+        self.assertEqual(sanitize_input('say "hi"'), "say hi")
+        self.assertEqual(sanitize_input("it's"), "its")
+        self.assertEqual(sanitize_input("<>\"'"), "")
+
+    def test_truncate(self):
+        """测试超长文本截断"""
+        self.assertEqual(sanitize_input("a" * 20, max_length=10), "a" * 10 + "...")
+        self.assertEqual(sanitize_input("a" * 10, max_length=10), "a" * 10)
+        # 先移除危险字符再判断长度
+        self.assertEqual(sanitize_input("<<<<<abc", max_length=3), "abc")
+
+    def test_non_ascii_text(self):
+        """测试非ASCII文本"""
+        self.assertEqual(sanitize_input("  你好，世界！  "), "你好，世界！")
+        self.assertEqual(sanitize_input("你好<世界>\n"), "你好世界")
+        self.assertEqual(sanitize_input("你好世界", max_length=2), "你好...")
+
+
+class TestExtractKeywords(unittest.TestCase):
+    """extract_keywords测试类"""
+
+    def test_punctuation_and_case(self):
+        """测试去除标点、统一小写并去重"""
+        self.assertEqual(
+            extract_keywords("Hello, World! hello again."),
+            ["hello", "world", "again"]
+        )
+
+    def test_stop_words_and_short_words(self):
+        """测试过滤停用词和单字符词"""
+        self.assertEqual(extract_keywords("The cat and a hat x"), ["cat", "hat"])
+
+    def test_keep_underscore(self):
+        """测试保留下划线"""
+        self.assertEqual(extract_keywords("snake_case, is_ok!"), ["snake_case", "is_ok"])
+
+    def test_non_ascii_text(self):
+        """测试非ASCII文本"""
+        self.assertEqual(extract_keywords("插件，配置！测试_工具"), ["插件", "配置", "测试_工具"])
+        self.assertEqual(extract_keywords("我 的 插件"), ["插件"])
+        self.assertEqual(extract_keywords("Café-au_lait"), ["café", "au_lait"])
+
+
+class TestDeepMergeDict(unittest.TestCase):
+    """deep_merge_dict测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.base = {
+            "plugin": {"enabled": True, "name": "test"},
+            "features": {"greeting": {"enabled": True, "style": "casual"}},
+            "version": "1.0.0",
+        }
+
+    def test_merge_nested_keys(self):
+        """测试嵌套键逐层合并"""
+        result = deep_merge_dict(self.base, {
+            "features": {"greeting": {"style": "formal"}},
+            "advanced": {"debug": True},
+        })
+
+        self.assertEqual(result["features"]["greeting"], {"enabled": True, "style": "formal"})
+        self.assertEqual(result["plugin"], {"enabled": True, "name": "test"})
+        self.assertEqual(result["advanced"], {"debug": True})
+        self.assertEqual(result["version"], "1.0.0")
+
+    def test_dict1_not_mutated(self):
+        """测试不修改dict1及其子字典"""
+        plugin = self.base["plugin"]
+        greeting = self.base["features"]["greeting"]
+
+        result = deep_merge_dict(self.base, {
+            "plugin": {"name": "changed"},
+            "features": {"greeting": {"style": "formal"}},
+        })
+
+        self.assertEqual(plugin, {"enabled": True, "name": "test"})
+        self.assertEqual(greeting, {"enabled": True, "style": "casual"})
+        self.assertIs(self.base["plugin"], plugin)
+        self.assertIsNot(result["plugin"], plugin)
+        self.assertIsNot(result["features"]["greeting"], greeting)
+
+    def test_non_dict_overrides_dict(self):
+        """测试非字典值覆盖字典值"""
+        result = deep_merge_dict(self.base, {"features": None, "version": {"major": 1}})
+
+        self.assertIsNone(result["features"])
+        self.assertEqual(result["version"], {"major": 1})
+        self.assertIsInstance(self.base["features"], dict)
+
+    def test_empty_dict2(self):
+        """测试dict2为空时的返回值"""
+        copied = deep_merge_dict(self.base, {})
+        self.assertEqual(copied, self.base)
+        self.assertIsNot(copied, self.base)
+
+        self.assertIs(deep_merge_dict(self.base, {}, copy=False), self.base)
+
+
+class TestPerformanceMonitor(unittest.TestCase):
+    """PerformanceMonitor测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.monitor = PerformanceMonitor()
+
+    def test_start_and_end_timer(self):
+        """测试计时并记录耗时"""
+        self.monitor.start_timer("task")
+        elapsed = self.monitor.end_timer("task")
+
+        self.assertIsInstance(elapsed, float)
+        self.assertGreaterEqual(elapsed, 0.0)
+
+        metrics = self.monitor.get_metrics()
+        self.assertEqual(set(metrics["task"]), {"start", "elapsed"})
+        self.assertIsInstance(metrics["task"]["start"], float)
+        self.assertEqual(metrics["task"]["elapsed"], elapsed)
+
+    def test_start_timer_without_end(self):
+        """测试未结束的计时只记录开始时间"""
+        self.monitor.start_timer("pending")
+
+        metrics = self.monitor.get_metrics()
+        self.assertIn("start", metrics["pending"])
+        self.assertNotIn("elapsed", metrics["pending"])
+
+    def test_end_unknown_timer(self):
+        """测试结束未开始的计时返回0.0"""
+        self.assertEqual(self.monitor.end_timer("unknown"), 0.0)
+        self.assertEqual(self.monitor.get_metrics(), {})
+
+    def test_get_metrics_returns_copy(self):
+        """测试get_metrics返回副本"""
+        self.monitor.start_timer("task")
+        self.monitor.end_timer("task")
+
+        metrics = self.monitor.get_metrics()
+        metrics.pop("task")
+        self.assertIn("task", self.monitor.get_metrics())
+
+
+if __name__ == '__main__':
+    # 运行测试
+    unittest.main(verbosity=2)
@@ -13,18 +13,50 @@ from unittest.mock import Mock, patch, AsyncMock
 import sys
 import os
 
-# 添加插件路径到Python路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 添加插件路径到Python路径（已存在时不重复添加）
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from plugin import ExampleTemplatePlugin
+from src.plugin_system.base.config_types import ConfigField
 
 
-class TestExampleTemplatePlugin(unittest.TestCase):
+# 布尔配置字段的期望默认值：(配置节, 字段, 默认值)
+_BOOL_FIELDS = (
+    ("plugin", "enabled", True),
+    ("plugin", "debug_mode", False),
+    ("features", "enable_greetings", True),
+    ("actions", "enable_emoji", True),
+)
+
+# log_level字段的期望选择项
+_EXPECTED_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+
+def _flatten(config, prefix=""):
+    """将嵌套配置展开为点分路径字典，保留中间节点以支持整节读取"""
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+    return flat
+
+
+class TestExampleTemplatePlugin(unittest.IsolatedAsyncioTestCase):
     """插件核心功能测试类"""
     
+    @classmethod
+    def setUpClass(cls):
+        """所有测试共用一个插件实例和配置Schema"""
+        cls._plugin = ExampleTemplatePlugin()
+        cls._schema = cls._plugin.config_schema
+    
     def setUp(self):
         """测试前的设置"""
-        self.plugin = ExampleTemplatePlugin()
+        self.plugin = self._plugin
         
         # 模拟配置
         self.mock_config = {
@@ -41,21 +73,24 @@ class TestExampleTemplatePlugin(unittest.TestCase):
             }
         }
         
+        # 展开为点分路径，get_config只需一次字典查询
+        self._flat = _flatten(self.mock_config)
+        
         # 模拟get_config方法
         self.plugin.get_config = Mock(side_effect=self._mock_get_config)
     
     def _mock_get_config(self, key, default=None):
         """模拟配置获取"""
-        keys = key.split('.')
+        return self._flat.get(key, default)
+    
+    def _set_config(self, path, value):
+        """修改模拟配置并重新展开"""
+        *sections, last = path.split('.')
         current = self.mock_config
-        
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return default
-        
-        return current
+        for section in sections:
+            current = current.setdefault(section, {})
+        current[last] = value
+        self._flat = _flatten(self.mock_config)
     
     def test_plugin_basic_info(self):
         """测试插件基本信息"""
@@ -66,7 +101,7 @@ class TestExampleTemplatePlugin(unittest.TestCase):
     
     def test_config_schema_structure(self):
         """测试配置Schema结构"""
-        schema = self.plugin.config_schema
+        schema = self._schema
         
         # 检查必需的配置节
         required_sections = ["plugin", "features", "actions", "commands", "advanced"]
@@ -84,7 +119,7 @@ class TestExampleTemplatePlugin(unittest.TestCase):
         descriptions = self.plugin.config_section_descriptions
         
         # 检查所有配置节都有描述
-        for section in self.plugin.config_schema.keys():
+        for section in self._schema.keys():
             self.assertIn(section, descriptions, f"配置节 {section} 缺少描述")
     
     def test_get_plugin_components_enabled(self):
@@ -103,7 +138,7 @@ class TestExampleTemplatePlugin(unittest.TestCase):
     def test_get_plugin_components_disabled(self):
         """测试禁用状态下的组件注册"""
         # 禁用插件
-        self.mock_config["plugin"]["enabled"] = False
+        self._set_config("plugin.enabled", False)
         
         components = self.plugin.get_plugin_components()
         
@@ -113,7 +148,7 @@ class TestExampleTemplatePlugin(unittest.TestCase):
     def test_get_plugin_components_feature_disabled(self):
         """测试功能禁用状态下的组件注册"""
         # 禁用问候功能
-        self.mock_config["features"]["enable_greetings"] = False
+        self._set_config("features.enable_greetings", False)
         
         components = self.plugin.get_plugin_components()
         component_types = [comp[1].__name__ for comp in components]
@@ -129,7 +164,7 @@ class TestExampleTemplatePlugin(unittest.TestCase):
     async def test_on_plugin_load_with_performance_monitor(self, mock_init_monitor):
         """测试性能监控初始化"""
         # 启用性能监控
-        self.mock_config["advanced"] = {"performance_monitor": True}
+        self._set_config("advanced.performance_monitor", True)
         
         await self.plugin.on_plugin_load()
         
@@ -140,7 +175,7 @@ class TestExampleTemplatePlugin(unittest.TestCase):
     async def test_on_plugin_unload_with_cache(self, mock_cleanup_cache):
         """测试缓存清理"""
         # 启用缓存
-        self.mock_config["advanced"] = {"cache_enabled": True}
+        self._set_config("advanced.cache_enabled", True)
         
         await self.plugin.on_plugin_unload()
         
@@ -149,52 +184,39 @@ class TestExampleTemplatePlugin(unittest.TestCase):
     
     def test_config_field_types(self):
         """测试配置字段类型定义"""
-        from src.plugin_system.base.config_types import ConfigField
-        
-        schema = self.plugin.config_schema
-        
-        # 检查所有字段都是ConfigField类型
-        def check_config_fields(section):
-            for key, field in section.items():
-                self.assertIsInstance(field, ConfigField, 
-                                    f"配置字段 {key} 应该是 ConfigField 类型")
-                
-                # 检查必需属性
-                self.assertIsNotNone(field.type, f"字段 {key} 缺少类型定义")
-                self.assertIsNotNone(field.default, f"字段 {key} 缺少默认值")
-                self.assertIsNotNone(field.description, f"字段 {key} 缺少描述")
+        schema = self._schema
         
-        for section_name, section in schema.items():
-            check_config_fields(section)
+        # 所有字段都应是ConfigField，且类型、默认值、描述齐全；一次性汇总不合格字段
+        invalid_fields = [
+            f"{section_name}.{key}"
+            for section_name, section in schema.items()
+            for key, field in section.items()
+            if not (isinstance(field, ConfigField)
+                    and field.type is not None
+                    and field.default is not None
+                    and field.description is not None)
+        ]
+        self.assertEqual(invalid_fields, [],
+                        f"以下配置字段不是完整的 ConfigField: {invalid_fields}")
     
     def test_config_default_values(self):
         """测试配置默认值的合理性"""
-        schema = self.plugin.config_schema
+        schema = self._schema
         
         # 检查布尔类型的默认值
-        bool_fields = {
-            "plugin.enabled": True,
-            "plugin.debug_mode": False,
-            "features.enable_greetings": True,
-            "actions.enable_emoji": True
-        }
-        
-        for field_path, expected_default in bool_fields.items():
-            keys = field_path.split('.')
-            field = schema[keys[0]][keys[1]]
-            self.assertEqual(field.default, expected_default, 
-                           f"字段 {field_path} 的默认值应该是 {expected_default}")
+        for section, key, expected_default in _BOOL_FIELDS:
+            self.assertEqual(schema[section][key].default, expected_default, 
+                           f"字段 {section}.{key} 的默认值应该是 {expected_default}")
     
     def test_config_choices_validation(self):
         """测试配置选择项验证"""
-        schema = self.plugin.config_schema
+        schema = self._schema
         
         # 检查有选择项的字段
         log_level_field = schema["advanced"]["log_level"]
         self.assertIsNotNone(log_level_field.choices, "log_level 应该有选择项")
         
-        expected_choices = ["DEBUG", "INFO", "WARNING", "ERROR"]
-        self.assertEqual(log_level_field.choices, expected_choices,
+        self.assertEqual(tuple(log_level_field.choices), _EXPECTED_LOG_LEVELS,
                         "log_level 的选择项不正确")
         
         # 默认值应该在选择项中
@@ -205,9 +227,14 @@ class TestExampleTemplatePlugin(unittest.TestCase):
 class TestPluginConfiguration(unittest.TestCase):
     """插件配置系统测试"""
     
+    @classmethod
+    def setUpClass(cls):
+        """只读测试共用一个插件实例"""
+        cls._plugin = ExampleTemplatePlugin()
+    
     def test_config_version_management(self):
         """测试配置版本管理"""
-        plugin = ExampleTemplatePlugin()
+        plugin = self._plugin
         
         # 检查配置版本字段存在
         config_version_field = plugin.config_schema["plugin"]["config_version"]
@@ -216,12 +243,12 @@ class TestPluginConfiguration(unittest.TestCase):
     
     def test_config_file_name(self):
         """测试配置文件名"""
-        plugin = ExampleTemplatePlugin()
+        plugin = self._plugin
         self.assertEqual(plugin.config_file_name, "config.toml")
     
     def test_section_descriptions_completeness(self):
         """测试配置节描述的完整性"""
-        plugin = ExampleTemplatePlugin()
+        plugin = self._plugin
         
         schema_sections = set(plugin.config_schema.keys())
         description_sections = set(plugin.config_section_descriptions.keys())
@@ -6,7 +6,35 @@
 
 import json
 import re
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from time import perf_counter_ns, time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# ==================== 预编译的正则表达式 ====================
+# 非单词、非空白字符（标点符号等）
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# 版本号：跳过前缀后取最多三段数字，缺失的段视为0
+_VERSION_RE = re.compile(r'\D*(\d+)(?:\.(\d+))?(?:\.(\d+))?')
+
+# ==================== 常量 ====================
+# 输入中需要移除的危险字符：尖括号、引号及控制字符
+_SANITIZE_CHARS = '<>"\''
+_SANITIZE_TABLE = dict.fromkeys([*map(ord, _SANITIZE_CHARS), *range(0x20)])
+
+# ASCII范围内的标点等非单词、非空白字符映射为空格，与_NON_WORD_RE的结果一致
+_ASCII_PUNCT_TABLE = {cp: ' ' for cp in range(128) if _NON_WORD_RE.match(chr(cp))}
+
+# 嵌套取值时表示“键不存在”的哨兵
+_MISS = object()
+
+# 关键词提取的停用词（简化版）
+_STOP_WORDS = frozenset({
+    '的', '了', '在', '是', '我', '你', '他', '她', '它', '们',
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to'
+})
 
 
 def validate_json_schema(data: dict, schema: dict) -> tuple[bool, str]:
@@ -49,16 +77,17 @@ def format_config_value(value: Any) -> str:
     elif isinstance(value, str):
         return f'"{value}"'
     elif isinstance(value, list):
-        return f"[{', '.join(map(str, value))}]"
+        return "[" + ", ".join(map(str, value)) + "]"
     elif isinstance(value, bool):
         return "true" if value else "false"
     else:
         return str(value)
 
 
+@lru_cache(maxsize=512)
 def parse_version(version_str: str) -> tuple[int, int, int]:
     """
-    解析版本号字符串
+    解析版本号字符串（结果按版本号字符串缓存）
     
     Args:
         version_str: 版本号字符串，如 "1.2.3"
@@ -66,18 +95,13 @@ def parse_version(version_str: str) -> tuple[int, int, int]:
     Returns:
         (主版本号, 次版本号, 修订号)
     """
-    # 移除可能的前缀和后缀
-    clean_version = re.sub(r'[^0-9.]', '', version_str)
-    parts = clean_version.split('.')
-    
-    # 确保有三个部分
-    while len(parts) < 3:
-        parts.append('0')
-    
-    try:
-        return int(parts[0]), int(parts[1]), int(parts[2])
-    except ValueError:
+    # 一次匹配取出三段数字，忽略前缀和后缀
+    match = _VERSION_RE.match(version_str)
+    if match is None:
         return 0, 0, 0
+    
+    major, minor, patch = match.groups('0')
+    return int(major), int(minor), int(patch)
 
 
 def compare_versions(version1: str, version2: str) -> int:
@@ -96,13 +120,8 @@ def compare_versions(version1: str, version2: str) -> int:
     v1_parts = parse_version(version1)
     v2_parts = parse_version(version2)
     
-    for v1, v2 in zip(v1_parts, v2_parts):
-        if v1 < v2:
-            return -1
-        elif v1 > v2:
-            return 1
-    
-    return 0
+    # 元组按元素逐个比较，结果映射为 -1/0/1
+    return (v1_parts > v2_parts) - (v1_parts < v2_parts)
 
 
 def sanitize_input(text: str, max_length: int = 1000) -> str:
@@ -119,8 +138,13 @@ def sanitize_input(text: str, max_length: int = 1000) -> str:
     if not text:
         return ""
     
+    # 快速路径：无控制字符、无需移除的符号且未超长时，直接返回
+    if (len(text) <= max_length and text.isprintable()
+            and not any(char in text for char in _SANITIZE_CHARS)):
+        return text.strip()
+    
     # 移除危险字符
-    sanitized = re.sub(r'[<>"\'\x00-\x1f]', '', text)
+    sanitized = text.translate(_SANITIZE_TABLE)
     
     # 限制长度
     if len(sanitized) > max_length:
@@ -142,27 +166,22 @@ def extract_keywords(text: str) -> List[str]:
     # 简单的关键词提取实现
     # 实际应用中可能需要更复杂的NLP处理
     
-    # 移除标点符号并分词
-    clean_text = re.sub(r'[^\w\s]', ' ', text.lower())
-    words = clean_text.split()
-    
-    # 过滤停用词（简化版）
-    stop_words = {
-        '的', '了', '在', '是', '我', '你', '他', '她', '它', '们',
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to'
-    }
-    
-    keywords = [word for word in words if word not in stop_words and len(word) > 1]
-    
-    # 去重并保持顺序
-    seen = set()
-    unique_keywords = []
-    for keyword in keywords:
-        if keyword not in seen:
-            seen.add(keyword)
-            unique_keywords.append(keyword)
+    # 移除标点符号并分词；纯ASCII文本走translate快速路径，否则回退到正则
+    lowered = text.lower()
+    if lowered.isascii():
+        words = lowered.translate(_ASCII_PUNCT_TABLE).split()
+    else:
+        words = _NON_WORD_RE.sub(' ', lowered).split()
     
-    return unique_keywords
+    # 过滤停用词，并借助dict.fromkeys去重且保持顺序
+    return list(dict.fromkeys(
+        word for word in words if len(word) > 1 and word not in _STOP_WORDS
+    ))
+
+
+def _utc_timestamp() -> str:
+    """当前UTC时间，格式如 2025-01-20T12:00:00Z"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def create_error_response(error_type: str, message: str, details: Optional[Dict] = None) -> Dict:
@@ -181,7 +200,7 @@ def create_error_response(error_type: str, message: str, details: Optional[Dict]
         "success": False,
         "error_type": error_type,
         "message": message,
-        "timestamp": "2025-01-20T12:00:00Z"  # 实际应用中应使用当前时间
+        "timestamp": _utc_timestamp()
     }
     
     if details:
@@ -205,28 +224,39 @@ def create_success_response(data: Any, message: str = "操作成功") -> Dict:
         "success": True,
         "message": message,
         "data": data,
-        "timestamp": "2025-01-20T12:00:00Z"  # 实际应用中应使用当前时间
+        "timestamp": _utc_timestamp()
     }
 
 
-def deep_merge_dict(dict1: Dict, dict2: Dict) -> Dict:
+def deep_merge_dict(dict1: Dict, dict2: Dict, copy: bool = True) -> Dict:
     """
     深度合并两个字典
     
     Args:
         dict1: 字典1
         dict2: 字典2
+        copy: dict2为空时是否返回dict1的副本；为False时直接返回dict1本身
         
     Returns:
         合并后的字典
     """
+    # 没有需要覆盖的内容时跳过合并
+    if not dict2:
+        return dict1.copy() if copy else dict1
+    
     result = dict1.copy()
     
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge_dict(result[key], value)
-        else:
-            result[key] = value
+    # 用显式栈代替递归；只复制需要合并的子字典，不修改dict1
+    stack = [(result, dict2)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
     
     return result
 
@@ -236,28 +266,28 @@ class ConfigHelper:
     
     @staticmethod
     def validate_config_key(key: str) -> bool:
-        """验证配置键格式"""
-        pattern = r"^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)*$"
-        return bool(re.match(pattern, key))
+        """验证配置键格式：由点分隔的ASCII标识符"""
+        return all(part.isascii() and part.isidentifier() for part in key.split('.'))
     
     @staticmethod
-    def parse_config_path(path: str) -> List[str]:
-        """解析配置路径"""
-        return path.split('.') if path else []
+    @lru_cache(maxsize=1024)
+    def parse_config_path(path: str) -> Tuple[str, ...]:
+        """解析配置路径（结果按路径字符串缓存，返回不可变元组）"""
+        return tuple(path.split('.')) if path else ()
     
     @staticmethod
-    def get_nested_value(data: Dict, path: List[str], default=None):
+    def get_nested_value(data: Dict, path: Sequence[str], default=None):
         """获取嵌套字典的值"""
         current = data
         for key in path:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
+            # 哨兵对象区分“键不存在”与“值为None”，每层只查一次字典
+            current = current.get(key, _MISS) if isinstance(current, dict) else _MISS
+            if current is _MISS:
                 return default
         return current
     
     @staticmethod
-    def set_nested_value(data: Dict, path: List[str], value: Any):
+    def set_nested_value(data: Dict, path: Sequence[str], value: Any):
         """设置嵌套字典的值"""
         current = data
         for key in path[:-1]:
@@ -272,20 +302,22 @@ class PerformanceMonitor:
     
     def __init__(self):
         self.metrics = {}
+        # 计时使用单调时钟（纳秒），metrics 中的 start 仍为时间戳，保持原有结构
+        self._starts: Dict[str, int] = {}
     
     def start_timer(self, name: str):
         """开始计时"""
-        import time
-        self.metrics[name] = {"start": time.time()}
+        self.metrics[name] = {"start": time()}
+        self._starts[name] = perf_counter_ns()
     
     def end_timer(self, name: str) -> float:
-        """结束计时并返回耗时"""
-        import time
-        if name in self.metrics:
-            elapsed = time.time() - self.metrics[name]["start"]
-            self.metrics[name]["elapsed"] = elapsed
-            return elapsed
-        return 0.0
+        """结束计时并返回耗时（秒）"""
+        start = self._starts.get(name)
+        if start is None:
+            return 0.0
+        elapsed = (perf_counter_ns() - start) / 1e9
+        self.metrics[name]["elapsed"] = elapsed
+        return elapsed
     
     def get_metrics(self) -> Dict:
         """获取性能指标"""